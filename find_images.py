@@ -0,0 +1,332 @@
+import os
+import re
+import functools
+import json
+import yaml
+import atexit
+import shutil
+import threading
+import concurrent.futures
+from pathlib import Path
+from collections import defaultdict
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from serpapi import GoogleSearch
+from tqdm import tqdm
+from dotenv import load_dotenv
+
+from pipeline_logging import get_logger
+
+load_dotenv()
+
+log = get_logger("find_images")
+
+DATA_DIR = Path("data-store")
+SERP_CACHE_PATH = DATA_DIR / ".serp-cache.json"
+SERP_CACHE_LOCK = threading.Lock()
+DOWNLOAD_META_PATH = DATA_DIR / ".download-meta.json"
+DOWNLOAD_META_LOCK = threading.Lock()
+
+_SANITIZE_RE = re.compile(r'[^a-z0-9]+')
+
+@functools.lru_cache(maxsize=4096)
+def sanitize_name(name: str) -> str:
+    """
+    Convert a string to lowercase, replace all non-alphanumeric
+    characters with dashes, and strip leading/trailing dashes.
+    """
+    return _SANITIZE_RE.sub('-', name.lower()).strip('-')
+
+# Global Session with retry logic
+SESSION = requests.Session()
+retry_strategy = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=[429, 500, 502, 503, 504]
+)
+adapter = HTTPAdapter(max_retries=retry_strategy)
+SESSION.mount("http://", adapter)
+SESSION.mount("https://", adapter)
+
+def load_products():
+    """
+    Loads all YAML from data-store/*.yaml, merging into a dict:
+    {
+      "DesignHouse": {
+         "ProductA": 1985,
+         "ProductB": 1990,
+      },
+      ...
+    }
+    """
+    products = defaultdict(dict)
+    for yaml_file in DATA_DIR.glob("*.yaml"):
+        try:
+            with yaml_file.open("rb") as f:
+                content = yaml.load(f, Loader=SafeLoader) or {}
+            for design_house, items in content.items():
+                if isinstance(items, dict):
+                    products[design_house].update(items)
+        except Exception as e:
+            log.error(f"Error loading {yaml_file.name}: {e}")
+    return dict(products)
+
+def iter_tasks(products=None):
+    """
+    Yields (design_house, product, year) for every product,
+    loading them with load_products() unless given.
+    """
+    if products is None:
+        products = load_products()
+    for design_house, items in products.items():
+        for product, year in items.items():
+            yield design_house, product, year
+
+def load_json_cache(path: Path):
+    """
+    Loads a JSON cache file, returning {} if it is missing or unreadable.
+    """
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        log.warning(f"Ignoring unreadable {path}: {e}")
+        return {}
+
+def save_json_cache(path: Path, cache, lock):
+    """
+    Writes a JSON cache back to path.
+    """
+    with lock:
+        data = json.dumps(cache, indent=2, sort_keys=True)
+    try:
+        path.write_text(data)
+    except Exception as e:
+        log.error(f"Error saving {path}: {e}")
+
+# Resolved SerpAPI image URLs:
+# { "DesignHouse": { "ProductA": "https://..." }, ... }
+SERP_CACHE = load_json_cache(SERP_CACHE_PATH)
+atexit.register(save_json_cache, SERP_CACHE_PATH, SERP_CACHE, SERP_CACHE_LOCK)
+
+# Completed downloads, keyed by save path:
+# { "data-store/dh/product-1985.jpg": { "url": ..., "size": 12345 }, ... }
+DOWNLOAD_META = load_json_cache(DOWNLOAD_META_PATH)
+atexit.register(save_json_cache, DOWNLOAD_META_PATH, DOWNLOAD_META, DOWNLOAD_META_LOCK)
+
+def record_download(save_path: Path, img_url, size):
+    """
+    Remembers the source URL and size of a completed download.
+    """
+    with DOWNLOAD_META_LOCK:
+        DOWNLOAD_META[save_path.as_posix()] = {"url": img_url, "size": size}
+
+def content_length(headers):
+    """
+    Returns the body size from response headers, or None if it is unknown,
+    malformed, or refers to a content-encoded body.
+    """
+    if "Content-Encoding" in headers:
+        return None
+    try:
+        return int(headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None
+
+def image_path(design_house, product, year) -> Path:
+    """
+    Returns data-store/<dh_sanitized>/<product_sanitized>-<year>.jpg.
+    """
+    return DATA_DIR / sanitize_name(design_house) / f"{sanitize_name(product)}-{year}.jpg"
+
+def resolve_url(design_house, product):
+    """
+    Use SerpAPI to find a large image with a white background,
+    searching for: <design_house> "<product>" large photo with white background.
+    Returns the original image URL (or None), consulting SERP_CACHE first.
+    """
+    with SERP_CACHE_LOCK:
+        cached = SERP_CACHE.get(design_house, {}).get(product)
+    if cached:
+        return cached
+
+    try:
+        # Product in quotes, "large photo with white background", tbs=isz:l
+        search = GoogleSearch({
+            "engine": "google_images",
+            "q": f"{design_house} \"{product}\" large photo with white background",
+            "api_key": os.getenv("SERP_API_KEY"),
+            "num": 1,
+            "tbs": "isz:l"
+        })
+        result = search.get_dict()
+        img_url = result.get("images_results", [{}])[0].get("original")
+    except Exception as e:
+        log.error(f"Search failed {design_house}/{product}: {e}")
+        return None
+
+    if img_url:
+        with SERP_CACHE_LOCK:
+            SERP_CACHE.setdefault(design_house, {})[product] = img_url
+    return img_url
+
+def forget_url(design_house, product):
+    """
+    Drops a cached SerpAPI result so the next run searches again.
+    """
+    with SERP_CACHE_LOCK:
+        SERP_CACHE.get(design_house, {}).pop(product, None)
+
+def is_client_error(exc):
+    """
+    True if exc is an HTTP 4xx response, i.e. the URL itself is dead or blocked.
+    """
+    response = getattr(exc, "response", None)
+    return isinstance(exc, requests.HTTPError) and response is not None and 400 <= response.status_code < 500
+
+def needs_download(design_house, product, save_path: Path):
+    """
+    Returns True if save_path is missing or does not match the size recorded
+    in DOWNLOAD_META (e.g. it was truncated). Files from before DOWNLOAD_META
+    existed are checked against a HEAD of their cached URL, if there is one.
+    """
+    if not save_path.exists():
+        return True
+    size = save_path.stat().st_size
+
+    with DOWNLOAD_META_LOCK:
+        meta = DOWNLOAD_META.get(save_path.as_posix())
+    if meta is not None:
+        return meta.get("size") != size
+
+    with SERP_CACHE_LOCK:
+        img_url = SERP_CACHE.get(design_house, {}).get(product)
+    if not img_url:
+        return False  # Nothing to compare against; keep the existing file.
+    try:
+        resp = SESSION.head(img_url, timeout=30, allow_redirects=True)
+        resp.raise_for_status()
+    except Exception:
+        return False
+    length = content_length(resp.headers)
+    if length is not None and length != size:
+        return True
+    record_download(save_path, img_url, size)
+    return False
+
+def resolve_if_needed(design_house, product, save_path: Path):
+    """
+    Returns the image URL to fetch for save_path, or None if it is complete.
+    """
+    if not needs_download(design_house, product, save_path):
+        return None
+    return resolve_url(design_house, product)
+
+def fetch_image(img_url, save_path: Path):
+    """
+    Streams img_url to a temporary file next to save_path and moves it into
+    place once the full Content-Length has arrived, so an interrupted
+    download never leaves a truncated save_path behind.
+    """
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = save_path.with_name(save_path.name + ".part")
+    try:
+        with SESSION.get(img_url, timeout=30, stream=True) as resp:
+            resp.raise_for_status()
+            size = 0
+            with open(part_path, "wb") as f:
+                for chunk in resp.iter_content(65536):
+                    f.write(chunk)
+                    size += len(chunk)
+            length = content_length(resp.headers)
+            if length is not None and length != size:
+                raise IOError(f"incomplete download ({size} of {length} bytes)")
+        os.replace(part_path, save_path)
+    except Exception:
+        part_path.unlink(missing_ok=True)
+        raise
+    record_download(save_path, img_url, size)
+
+def link_image(source_path: Path, save_path: Path):
+    """
+    Hard-links an already downloaded image to save_path (copying if the
+    filesystem refuses the link) and records it in DOWNLOAD_META.
+    """
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    save_path.unlink(missing_ok=True)
+    try:
+        os.link(source_path, save_path)
+    except OSError:
+        shutil.copyfile(source_path, save_path)
+    with DOWNLOAD_META_LOCK:
+        meta = dict(DOWNLOAD_META.get(source_path.as_posix(), {}))
+        meta["size"] = save_path.stat().st_size
+        DOWNLOAD_META[save_path.as_posix()] = meta
+
+def main():
+    # Products that sanitize to the same name and year share a save_path;
+    # keep only the first so two fetches never write the same file.
+    tasks = {}
+    for dh, product, year in iter_tasks():
+        save_path = image_path(dh, product, year)
+        if save_path in tasks:
+            log.warning(f"Skipping {dh}/{product}: same image path as {tasks[save_path][0]}/{tasks[save_path][1]}")
+            continue
+        tasks[save_path] = (dh, product)
+
+    # Two pipelined stages: each resolved URL is handed to the fetch pool
+    # straight away, so slow SerpAPI lookups don't hold back CDN downloads.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as resolve_pool, \
+         concurrent.futures.ThreadPoolExecutor(max_workers=64) as fetch_pool:
+        resolve_futures = {
+            resolve_pool.submit(resolve_if_needed, dh, product, save_path): (dh, product, save_path)
+            for save_path, (dh, product) in tasks.items()
+        }
+        # Products that resolve to the same URL share one download; the
+        # first save_path is fetched and the rest are linked to it.
+        url_targets = defaultdict(list)
+        fetch_futures = {}
+        for future in tqdm(concurrent.futures.as_completed(resolve_futures), total=len(resolve_futures), desc="Checking"):
+            dh, product, save_path = resolve_futures[future]
+            img_url = future.result()
+            if not img_url:
+                continue
+            if img_url not in url_targets:
+                fetch_futures[fetch_pool.submit(fetch_image, img_url, save_path)] = img_url
+            url_targets[img_url].append((dh, product, save_path))
+
+        for future in tqdm(concurrent.futures.as_completed(fetch_futures), total=len(fetch_futures), desc="Downloading"):
+            img_url = fetch_futures[future]
+            (dh, product, save_path), *duplicates = url_targets[img_url]
+            # Products that sanitize to the same name and year already share
+            # save_path; linking onto it would delete the download.
+            duplicates = [d for d in duplicates if d[2] != save_path]
+            try:
+                future.result()
+                log.info(f"Downloaded {dh}/{product}")
+            except Exception as e:
+                log.error(f"Failed {dh}/{product}: {e}")
+                for dup_dh, dup_product, _ in duplicates:
+                    log.error(f"Skipped {dup_dh}/{dup_product}: shares the failed download of {dh}/{product}")
+                # A 4xx means the cached URL is dead; search again next run.
+                if is_client_error(e):
+                    for target_dh, target_product, _ in url_targets[img_url]:
+                        forget_url(target_dh, target_product)
+                continue
+            for dup_dh, dup_product, dup_path in duplicates:
+                try:
+                    link_image(save_path, dup_path)
+                    log.info(f"Linked {dup_dh}/{dup_product} to {dh}/{product}")
+                except Exception as e:
+                    log.error(f"Failed {dup_dh}/{dup_product}: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import os
+import json
+import glob
+import yaml
+import concurrent.futures
+from pathlib import Path
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Define input and output directories.
+INPUT_DIR = "data-yaml"  # Folder containing your YAML files
+OUTPUT_DIR = "ts-data"   # Folder where the .ts files will be saved
+TIMELINE_KEYS = ("id", "year", "imageUrl", "name")
+
+def convert(yaml_path):
+    """
+    Converts one YAML file of timeline items into TypeScript source.
+    Returns (ts_filename, content), or None if the file is skipped.
+    """
+    with open(yaml_path, "rb") as f:
+        try:
+            data = yaml.load(f, Loader=SafeLoader)
+        except Exception as e:
+            print(f"Error parsing {yaml_path}: {e}")
+            return None
+
+    # Assume each YAML file contains a list of timeline items
+    # Each item should have: id, year, imageUrl, name.
+    if not isinstance(data, list):
+        print(f"Skipping {yaml_path}: YAML content is not a list.")
+        return None
+
+    # Use the YAML file's base name to generate the export variable name.
+    base_name = os.path.splitext(os.path.basename(yaml_path))[0]
+    # e.g., if file is "os.yaml" then we get "osData"
+    export_var = f"{base_name}Data"
+
+    # Keep only timeline items that carry every required key.
+    items = []
+    for item in data:
+        # Validate required keys in each timeline item.
+        if not isinstance(item, dict) or not all(key in item for key in TIMELINE_KEYS):
+            print(f"Skipping an item in {yaml_path}: missing one of the required keys.")
+            continue
+        items.append({key: item[key] for key in TIMELINE_KEYS})
+
+    # A JSON array is a valid TS array literal and escapes strings correctly.
+    # Values YAML parses into non-JSON types (e.g. dates) are written as strings.
+    body = json.dumps(items, indent=2, ensure_ascii=False, default=str)
+    ts_content = (
+        'import type { TimelineItem } from "./types";\n\n'
+        f"export const {export_var}: TimelineItem[] = {body};\n"
+    )
+
+    ts_filename = os.path.join(OUTPUT_DIR, f"{base_name}.ts")
+    return ts_filename, ts_content
+
+def main():
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    # Each file is independent and CPU-bound, so convert them across processes.
+    yaml_paths = glob.glob(os.path.join(INPUT_DIR, "*.yaml"))
+    with concurrent.futures.ProcessPoolExecutor() as pool:
+        for result in pool.map(convert, yaml_paths):
+            if result is None:
+                continue
+            # Write the TS file to the output directory.
+            ts_filename, ts_content = result
+            Path(ts_filename).write_text(ts_content, encoding="utf-8")
+            print(f"Generated {ts_filename}")
+
+if __name__ == "__main__":
+    main()
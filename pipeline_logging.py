@@ -0,0 +1,49 @@
+import queue
+import atexit
+import logging
+import logging.handlers
+
+from colorama import Fore, Style
+
+# Message colour per log level.
+LEVEL_COLORS = {
+    logging.INFO: Fore.GREEN,
+    logging.WARNING: Fore.YELLOW,
+    logging.ERROR: Fore.RED,
+    logging.CRITICAL: Fore.RED,
+}
+
+# Parent logger for every stage; see get_logger().
+PIPELINE_LOGGER = "pipeline"
+
+_listener = None
+
+class ColorFormatter(logging.Formatter):
+    """
+    Colours each record by level. Runs only on the listener thread.
+    """
+    def format(self, record):
+        message = super().format(record)
+        color = LEVEL_COLORS.get(record.levelno)
+        return f"{color}{message}{Style.RESET_ALL}" if color else message
+
+def get_logger(name):
+    """
+    Returns the "pipeline.<name>" logger. On first use, routes the "pipeline"
+    logger through a QueueHandler so worker threads only enqueue records and
+    a single listener thread does the formatting and the writes to stderr.
+    The root logger is left alone so third-party INFO logs stay quiet.
+    """
+    global _listener
+    if _listener is None:
+        handler = logging.StreamHandler()
+        handler.setFormatter(ColorFormatter("%(message)s"))
+        log_queue = queue.SimpleQueue()
+        pipeline = logging.getLogger(PIPELINE_LOGGER)
+        pipeline.setLevel(logging.INFO)
+        pipeline.addHandler(logging.handlers.QueueHandler(log_queue))
+        pipeline.propagate = False
+        _listener = logging.handlers.QueueListener(log_queue, handler)
+        _listener.start()
+        atexit.register(_listener.stop)
+    return logging.getLogger(f"{PIPELINE_LOGGER}.{name}")
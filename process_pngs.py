@@ -0,0 +1,127 @@
+import os
+import base64
+import mimetypes
+import shutil
+import concurrent.futures
+import replicate
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tqdm import tqdm
+
+from pipeline_logging import get_logger
+
+log = get_logger("process_pngs")
+
+if 'REPLICATE_API_TOKEN' not in os.environ:
+    raise ValueError("REPLICATE_API_TOKEN environment variable not set")
+
+client = replicate.Client(api_token=os.environ['REPLICATE_API_TOKEN'])
+model_version = "alexgenovese/remove-background-bria-2:8a67c9d842f7c06fef1b6bcf44bfdccb48b6cca3b420843e705d4a64e04f8974"
+
+# Number of predictions kept in flight against Replicate at once.
+MAX_WORKERS = 16
+
+# Global session with retry logic, sized for the worker pool so
+# downloads reuse keep-alive connections to Replicate's CDN.
+SESSION = requests.Session()
+retry_strategy = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504]
+)
+adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry_strategy)
+SESSION.mount("http://", adapter)
+SESSION.mount("https://", adapter)
+
+
+def derive_dst(source_path):
+    """
+    Map data-store/<dir>/<name>.<ext> to data-store-processed/<dir>/<name>.png.
+    """
+    relative_path = os.path.relpath(source_path, 'data-store')
+    dest_relative = os.path.splitext(relative_path)[0] + '.png'
+    return os.path.join('data-store-processed', dest_relative)
+
+
+def pending(root='data-store', seen=None):
+    """
+    Yield (source_path, dest_path) for every image under root that has
+    not been processed yet, walking the tree with os.scandir. Sources that
+    map to the same dest_path (e.g. foo.jpg and foo.png) are yielded once.
+    """
+    if seen is None:
+        seen = set()
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from pending(entry.path, seen)
+            elif entry.name.lower().endswith(('.jpg', '.jpeg', '.png')):
+                dest_path = derive_dst(entry.path)
+                if dest_path in seen or os.path.exists(dest_path):
+                    continue
+                seen.add(dest_path)
+                yield entry.path, dest_path
+
+
+def process_one(task):
+    """
+    Run background removal for a single (source_path, dest_path) pair
+    and write the resulting PNG to dest_path.
+    """
+    source_path, dest_path = task
+
+    try:
+        with open(source_path, 'rb') as f:
+            image_data = f.read()
+    except Exception as e:
+        log.error(f"Error reading {source_path}: {e}")
+        return
+
+    mime_type = mimetypes.guess_type(source_path)[0] or 'application/octet-stream'
+    base64_data = base64.b64encode(image_data).decode('utf-8')
+    data_url = f"data:{mime_type};base64,{base64_data}"
+
+    try:
+        output_url = client.run(model_version, input={"image": data_url})
+    except Exception as e:
+        log.error(f"API error processing {source_path}: {e}")
+        return
+
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+
+    # Write to a .part file so an interrupted download never leaves a
+    # truncated dest_path that pending() would treat as processed.
+    part_path = dest_path + '.part'
+    try:
+        with SESSION.get(output_url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(part_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=64 * 1024)
+        os.replace(part_path, dest_path)
+    except (requests.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
+        log.error(f"Failed to download processed image for {source_path}: {e}")
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        return
+
+    log.info(f"Successfully processed: {source_path} -> {dest_path}")
+
+
+def main():
+    os.makedirs('data-store-processed', exist_ok=True)
+
+    tasks = list(pending())
+
+    # Keep many predictions in flight so total runtime is bounded by
+    # Replicate's queue rather than by one round-trip per image.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(process_one, task) for task in tasks]
+        for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="Processing"):
+            future.result()
+
+
+if __name__ == "__main__":
+    main()
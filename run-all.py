@@ -1,15 +1,18 @@
-import subprocess
+import importlib
+import traceback
 from colorama import Fore, Style
 
-SCRIPTS = ["1-find-images.py", "2-process-pngs.py", "3-upload-to-ibb.py", "4-generate-and-deploy.py"]
+# Pipeline stages, run in order in this interpreter.
+STAGES = ["find_images", "process_pngs", "upload_to_ibb", "generate_and_deploy"]
 
 if __name__ == "__main__":
     print(f"{Fore.YELLOW}Starting product catalog pipeline...{Style.RESET_ALL}")
-    for script in SCRIPTS:
+    for stage in STAGES:
         try:
-            print(f"{Fore.CYAN}Running {script}...")
-            subprocess.run(["python3", script], check=True)
-        except subprocess.CalledProcessError:
-            print(f"{Fore.RED}Error in {script}, aborting!")
+            print(f"{Fore.CYAN}Running {stage}...")
+            importlib.import_module(stage).main()
+        except Exception:
+            traceback.print_exc()
+            print(f"{Fore.RED}Error in {stage}, aborting!")
             exit(1)
     print(f"{Fore.GREEN}\nPipeline completed successfully! {Style.RESET_ALL}")
\ No newline at end of file
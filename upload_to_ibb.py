@@ -1,18 +1,27 @@
 import os
 import re
+import functools
 import yaml
-import base64
 import concurrent.futures
 from pathlib import Path
+from typing import Dict, List, Tuple
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from colorama import Fore, Style
 from dotenv import load_dotenv
 
+from pipeline_logging import get_logger
+
 load_dotenv()
 
+log = get_logger("upload_to_ibb")
+
 # Directories and API key.
 DATA_DIR = Path("data-store")
 PROCESSED_DIR = Path("data-store-processed")
@@ -21,13 +30,14 @@ IBB_API_KEY = os.getenv("IBB_API_KEY")
 # Ensure the processed folder exists.
 PROCESSED_DIR.mkdir(exist_ok=True)
 
+_SANITIZE_RE = re.compile(r'[^a-z0-9]+')
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_name(name: str) -> str:
     """
     Standard dash-based naming.
     """
-    name = name.lower()
-    name = re.sub(r'[^a-z0-9]+', '-', name)
-    return name.strip('-')
+    return _SANITIZE_RE.sub('-', name.lower()).strip('-')
 
 # Global session with retry logic.
 SESSION = requests.Session()
@@ -40,6 +50,9 @@ adapter = HTTPAdapter(max_retries=retry_strategy)
 SESSION.mount("http://", adapter)
 SESSION.mount("https://", adapter)
 
+# Size of the upload pool main() shares across all design houses and YAML files.
+UPLOAD_WORKERS = 32
+
 def unify_details(details):
     """
     Convert details into a dict with at least a 'year' key.
@@ -88,12 +101,12 @@ def upload_entry(design_house, product, details):
     1) Convert details to a dict.
     2) If an imgbb link already exists, skip upload.
     3) Otherwise, locate the corresponding PNG file in PROCESSED_DIR and
-       upload it to imgbb (using Base64 encoding).
+       upload it to imgbb (uploaded as a multipart file).
     4) Update the details with the returned direct URL.
     Returns the updated details and a flag indicating if a change was made.
     """
     if not IBB_API_KEY:
-        print(f"{Fore.RED}IBB_API_KEY not set{Style.RESET_ALL}")
+        log.error("IBB_API_KEY not set")
         return details, False
 
     details = unify_details(details)
@@ -110,79 +123,81 @@ def upload_entry(design_house, product, details):
         return details, False  # No processed image available
 
     try:
-        # Read the image and encode it in Base64.
+        # Send the file as multipart so it is not inflated by Base64.
         with open(png_path, "rb") as f:
-            image_bytes = f.read()
-        image_base64 = base64.b64encode(image_bytes).decode("utf-8")
-
-        response = SESSION.post(
-            "https://api.imgbb.com/1/upload",
-            data={"key": IBB_API_KEY, "image": image_base64}
-        )
+            response = SESSION.post(
+                "https://api.imgbb.com/1/upload",
+                params={"key": IBB_API_KEY},
+                files={"image": f}
+            )
         response.raise_for_status()
         data = response.json().get("data", {})
         details["image"] = data.get("url", "")
-        print(f"{Fore.GREEN}Uploaded {product}{Style.RESET_ALL}")
+        log.info(f"Uploaded {product}")
         return details, True
     except Exception as e:
-        print(f"{Fore.RED}Upload failed for {product}: {e}{Style.RESET_ALL}")
+        log.error(f"Upload failed for {product}: {e}")
         return details, False
 
-def process_yaml_file(yaml_file: Path):
+def read_yaml_file(yaml_file: Path):
     """
-    Reads a YAML file from DATA_DIR, fixes its structure if needed,
-    processes each product entry (uploading images if available) and writes the updated YAML
-    file to PROCESSED_DIR (using the same filename).
+    Reads a YAML file from DATA_DIR and fixes its structure if needed.
+    Returns None if the file could not be parsed.
     """
     try:
-        content = yaml.safe_load(yaml_file.read_text()) or {}
+        with yaml_file.open("rb") as f:
+            content = yaml.load(f, Loader=SafeLoader) or {}
     except Exception as e:
-        print(f"{Fore.RED}Error reading {yaml_file.name}: {e}{Style.RESET_ALL}")
-        return
+        log.error(f"Error reading {yaml_file.name}: {e}")
+        return None
 
     # Fix structure if needed.
-    content = fix_yaml_structure(content)
+    return fix_yaml_structure(content)
 
-    changed_any = False
+def submit_uploads(pool, content) -> List[Tuple[str, str, concurrent.futures.Future]]:
+    """
+    Submits an upload_entry job to pool for every product in content.
+    Returns (design_house, product, future) tuples in YAML order.
+    """
+    entries = []
     for design_house, products in content.items():
         # Ensure that products is a dict.
         if not isinstance(products, dict):
             continue
+        for product, details in products.items():
+            future = pool.submit(upload_entry, design_house, product, details)
+            entries.append((design_house, product, future))
+    return entries
 
-        updated_products = {}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            future_map = {
-                executor.submit(upload_entry, design_house, product, details): product
-                for product, details in products.items()
-            }
-            for future in concurrent.futures.as_completed(future_map):
-                prod = future_map[future]
-                new_details, changed = future.result()
-                if changed:
-                    changed_any = True
-                updated_products[prod] = new_details
-
-        content[design_house] = updated_products
+def process_yaml_file(yaml_file: Path, content, entries):
+    """
+    Waits for the submitted uploads of one YAML file, applies the updated
+    details to content and writes the updated YAML file to PROCESSED_DIR
+    (using the same filename). Returns the updated content.
+    """
+    changed_any = False
+    for design_house, product, future in entries:
+        new_details, changed = future.result()
+        if changed:
+            changed_any = True
+        content[design_house][product] = new_details
 
     output_path = PROCESSED_DIR / yaml_file.name
-    yaml.dump(content, stream=open(output_path, "w"), sort_keys=False)
+    with output_path.open("w", buffering=1 << 20) as fh:
+        yaml.dump(content, fh, Dumper=SafeDumper, sort_keys=False)
     if changed_any:
-        print(f"{Fore.GREEN}Updated {output_path}{Style.RESET_ALL}")
+        log.info(f"Updated {output_path}")
     else:
-        print(f"{Fore.YELLOW}No changes for {yaml_file.name}{Style.RESET_ALL}")
+        log.info(f"No changes for {yaml_file.name}")
+    return content
 
-def create_datatable():
+def create_datatable(contents):
     """
-    Combines all updated YAML files in PROCESSED_DIR into a single datatable YAML file.
+    Combines the updated YAML contents (as returned by process_yaml_file)
+    into a single datatable YAML file in PROCESSED_DIR.
     """
     datatable = {}
-    for yf in PROCESSED_DIR.glob("*.yaml"):
-        try:
-            content = yaml.safe_load(yf.read_text()) or {}
-        except Exception as e:
-            print(f"{Fore.RED}Error reading {yf.name}: {e}{Style.RESET_ALL}")
-            continue
-
+    for content in contents:
         for design_house, products in content.items():
             if not isinstance(products, dict):
                 continue
@@ -192,15 +207,31 @@ def create_datatable():
                 datatable[design_house][product] = details
 
     output_path = PROCESSED_DIR / "datatable.yaml"
-    output_path.write_text(yaml.dump(datatable, sort_keys=False))
-    print(f"{Fore.GREEN}Created datatable at {output_path}{Style.RESET_ALL}")
+    with output_path.open("w", buffering=1 << 20) as fh:
+        yaml.dump(datatable, fh, Dumper=SafeDumper, sort_keys=False)
+    log.info(f"Created datatable at {output_path}")
 
 def main():
-    # Process each YAML file from DATA_DIR and write updated versions to PROCESSED_DIR.
-    for yf in DATA_DIR.glob("*.yaml"):
-        process_yaml_file(yf)
-    # Create a consolidated datatable from the updated YAML files.
-    create_datatable()
+    # The pool is shut down before returning so no idle upload threads are
+    # left running when later stages fork worker processes.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+        # Queue uploads for every YAML file up front so they all share the pool.
+        file_contents: Dict[Path, dict] = {}
+        file_futures: Dict[Path, List[Tuple[str, str, concurrent.futures.Future]]] = {}
+        for yf in DATA_DIR.glob("*.yaml"):
+            content = read_yaml_file(yf)
+            if content is None:
+                continue
+            file_contents[yf] = content
+            file_futures[yf] = submit_uploads(pool, content)
+
+        # Write updated versions to PROCESSED_DIR as each file's uploads finish.
+        updated = [
+            process_yaml_file(yf, file_contents[yf], entries)
+            for yf, entries in file_futures.items()
+        ]
+    # Create a consolidated datatable from the updated contents in memory.
+    create_datatable(updated)
 
 if __name__ == "__main__":
     main()